@@ -1,11 +1,9 @@
 from __future__ import annotations
 
 import ast
-import pkgutil
 import re
 from collections import defaultdict
 from collections.abc import Iterable
-from functools import cached_property
 from typing import TYPE_CHECKING
 from typing import Any
 from typing import Callable
@@ -15,13 +13,13 @@ from typing import TypeVar
 from tokenize_rt import Offset
 from tokenize_rt import Token
 
-from django_upgrade import fixers
-
 
 class Settings:
     __slots__ = (
         "target_version",
         "enabled_fixers",
+        "fixer_groups",
+        "trigger_bytes",
     )
 
     def __init__(
@@ -38,6 +36,40 @@ class Settings:
             and (skip_fixers is None or name not in skip_fixers)
         }
 
+        # Pre-merge the AST functions of the active fixers, so that per-file
+        # work in get_ast_funcs() only has to check conditions. Runs of
+        # unconditional fixers share a group, keeping fixer order intact.
+        self.fixer_groups: list[
+            tuple[
+                Callable[[State], bool] | None, dict[type[ast.AST], list[ASTFunc[Any]]]
+            ]
+        ] = []
+        trigger_bytes: set[bytes] = set()
+        for fixer in FIXERS.values():
+            if fixer.name not in self.enabled_fixers:
+                continue
+            if fixer.min_version > target_version:
+                continue
+            if (
+                fixer.condition is None
+                and self.fixer_groups
+                and self.fixer_groups[-1][0] is None
+            ):
+                group_funcs = self.fixer_groups[-1][1]
+            else:
+                group_funcs = {}
+                self.fixer_groups.append((fixer.condition, group_funcs))
+            for type_, type_funcs in fixer.ast_funcs.items():
+                group_funcs.setdefault(type_, []).extend(type_funcs)
+            trigger_bytes.update(fixer.triggers)
+        # Sorted for a stable scan order.
+        self.trigger_bytes = tuple(sorted(trigger_bytes))
+
+    def __reduce__(self) -> tuple[type[Settings], tuple[tuple[int, int], set[str]]]:
+        # Fixer conditions may be lambdas, which can't be pickled, so rebuild
+        # from the inputs.
+        return (Settings, (self.target_version, self.enabled_fixers))
+
 
 admin_re = re.compile(r"(\b|_)admin(\b|_)")
 commands_re = re.compile(r"(^|[\\/])management[\\/]commands[\\/]")
@@ -48,8 +80,45 @@ test_re = re.compile(r"(\b|_)tests?(\b|_)")
 models_re = re.compile(r"(^|[\\/])models([\\/]|\.py)")
 
 
+# Modules that "admin" and "models" are imported from, tracked by
+# State.admin_imported and State.models_imported.
+ADMIN_MODULES = frozenset(("django.contrib", "django.contrib.gis"))
+MODELS_MODULES = frozenset(("django.db", "django.contrib.gis.db"))
+
+
+# Filename patterns for State flags, fused into a single pattern so that all
+# flags can be found in one scan. Each pattern is wrapped in a lookahead so
+# that matches don't consume characters needed by other patterns.
+filename_res = {
+    "admin": admin_re,
+    "command": commands_re,
+    "dunder_init": dunder_init_re,
+    "migrations": migrations_re,
+    "settings": settings_re,
+    "test": test_re,
+    "models": models_re,
+}
+filename_classifier_re = re.compile(
+    "|".join(f"(?=(?P<{kind}>{regex.pattern}))" for kind, regex in filename_res.items())
+)
+
+
 class State:
-    __slots__ = ("settings", "filename", "from_imports", "__weakref__", "__dict__")
+    __slots__ = (
+        "settings",
+        "filename",
+        "from_imports",
+        "admin_imported",
+        "models_imported",
+        "looks_like_admin_file",
+        "looks_like_command_file",
+        "looks_like_dunder_init_file",
+        "looks_like_migrations_file",
+        "looks_like_settings_file",
+        "looks_like_test_file",
+        "looks_like_models_file",
+        "__weakref__",
+    )
 
     def __init__(
         self,
@@ -60,34 +129,18 @@ class State:
         self.settings = settings
         self.filename = filename
         self.from_imports = from_imports
+        # Common from_imports checks, kept up to date by visit()
+        self.admin_imported = False
+        self.models_imported = False
 
-    @cached_property
-    def looks_like_admin_file(self) -> bool:
-        return admin_re.search(self.filename) is not None
-
-    @cached_property
-    def looks_like_command_file(self) -> bool:
-        return commands_re.search(self.filename) is not None
-
-    @cached_property
-    def looks_like_dunder_init_file(self) -> bool:
-        return dunder_init_re.search(self.filename) is not None
-
-    @cached_property
-    def looks_like_migrations_file(self) -> bool:
-        return migrations_re.search(self.filename) is not None
-
-    @cached_property
-    def looks_like_settings_file(self) -> bool:
-        return settings_re.search(self.filename) is not None
-
-    @cached_property
-    def looks_like_test_file(self) -> bool:
-        return test_re.search(self.filename) is not None
-
-    @cached_property
-    def looks_like_models_file(self) -> bool:
-        return models_re.search(self.filename) is not None
+        kinds = {match.lastgroup for match in filename_classifier_re.finditer(filename)}
+        self.looks_like_admin_file = "admin" in kinds
+        self.looks_like_command_file = "command" in kinds
+        self.looks_like_dunder_init_file = "dunder_init" in kinds
+        self.looks_like_migrations_file = "migrations" in kinds
+        self.looks_like_settings_file = "settings" in kinds
+        self.looks_like_test_file = "test" in kinds
+        self.looks_like_models_file = "models" in kinds
 
 
 AST_T = TypeVar("AST_T", bound=ast.AST)
@@ -114,50 +167,79 @@ def visit(
     tree: ast.Module,
     settings: Settings,
     filename: str,
-) -> dict[Offset, list[TokenFunc]]:
+) -> dict[int, list[TokenFunc]]:
+    """
+    Return token functions to run, keyed by packed offset:
+    (line << 32) | utf8_byte_offset. Int keys hash faster than Offset tuples
+    in the apply_fixers() loop over every token.
+    """
     state = State(
         settings=settings,
         filename=filename,
         from_imports=defaultdict(set),
     )
     ast_funcs = get_ast_funcs(state, settings)
-
-    nodes: list[tuple[ast.AST, tuple[ast.AST, ...]]] = [(tree, ())]
-    ret = defaultdict(list)
+    # Most nodes have no registered functions, so check a plain dict
+    # rather than have the defaultdict create empty lists for them.
+    dispatch: dict[type[ast.AST], list[ASTFunc[Any]]] = dict(ast_funcs.items())
+    interesting = dispatch.keys() | {ast.ImportFrom}
+
+    # Worklist entries carry their depth, with the ancestors of the current
+    # node kept in parent_stack. The parents tuple is only built for nodes
+    # that have registered functions.
+    nodes: list[tuple[ast.AST, int]] = [(tree, 0)]
+    nodes_append = nodes.append
+    parent_stack: list[ast.AST] = []
+    ret: dict[int, list[TokenFunc]] = {}
+    ret_setdefault = ret.setdefault
     while nodes:
-        node, parents = nodes.pop()
-
-        for ast_func in ast_funcs[type(node)]:
-            for offset, token_func in ast_func(state, node, parents):
-                ret[offset].append(token_func)
-
-        if (
-            isinstance(node, ast.ImportFrom)
-            and node.level == 0
-            and (
-                node.module is not None
+        node, depth = nodes.pop()
+        del parent_stack[depth:]
+
+        node_type = type(node)
+        if node_type in interesting:
+            funcs = dispatch.get(node_type)
+            if funcs:
+                parents = tuple(parent_stack)
+                for ast_func in funcs:
+                    for offset, token_func in ast_func(state, node, parents):
+                        ret_setdefault(
+                            (offset.line << 32) | offset.utf8_byte_offset, []
+                        ).append(token_func)
+
+            if (
+                isinstance(node, ast.ImportFrom)
+                and node.level == 0
                 and (
-                    node.module.startswith("django.")
-                    or node.module in ("django", "unittest")
+                    node.module is not None
+                    and (
+                        node.module.startswith("django.")
+                        or node.module in ("django", "unittest")
+                    )
+                )
+            ):
+                module_imports = state.from_imports[node.module]
+                module_imports.update(
+                    name.name
+                    for name in node.names
+                    if name.asname is None and name.name != "*"
                 )
-            )
-        ):
-            state.from_imports[node.module].update(
-                name.name
-                for name in node.names
-                if name.asname is None and name.name != "*"
-            )
-
-        subparents = parents + (node,)
+                if node.module in ADMIN_MODULES and "admin" in module_imports:
+                    state.admin_imported = True
+                elif node.module in MODELS_MODULES and "models" in module_imports:
+                    state.models_imported = True
+
+        parent_stack.append(node)
+        depth += 1
         for name in reversed(node._fields):
             value = getattr(node, name)
 
             if isinstance(value, ast.AST):
-                nodes.append((value, subparents))
+                nodes_append((value, depth))
             elif isinstance(value, list):
                 for subvalue in reversed(value):
                     if isinstance(subvalue, ast.AST):
-                        nodes.append((subvalue, subparents))
+                        nodes_append((subvalue, depth))
     return ret
 
 
@@ -167,6 +249,7 @@ class Fixer:
         "min_version",
         "ast_funcs",
         "condition",
+        "triggers",
     )
 
     def __init__(
@@ -174,12 +257,18 @@ class Fixer:
         module_name: str,
         min_version: tuple[int, int],
         condition: Callable[[State], bool] | None = None,
+        triggers: tuple[bytes, ...] = (b"django",),
     ) -> None:
         self.name = module_name.rpartition(".")[2]
         self.min_version = min_version
         self.ast_funcs: ASTCallbackMapping = defaultdict(list)
         self.condition = condition
+        # Byte strings, at least one of which must appear in a file for this
+        # fixer to change it. Most fixers only act on names imported from
+        # django, hence the default.
+        self.triggers = triggers
 
+        assert self.name not in FIXERS, f"duplicate fixer {self.name}"
         FIXERS[self.name] = self
 
     def register(
@@ -195,25 +284,14 @@ class Fixer:
 FIXERS: dict[str, Fixer] = {}
 
 
-def _import_fixers() -> None:
-    # https://github.com/python/mypy/issues/1422
-    fixers_path: str = fixers.__path__  # type: ignore [assignment]
-    mod_infos = pkgutil.walk_packages(fixers_path, f"{fixers.__name__}.")
-    for _, name, _ in mod_infos:
-        __import__(name, fromlist=["_trash"])
-
-
-_import_fixers()
-
-
 def get_ast_funcs(state: State, settings: Settings) -> ASTCallbackMapping:
     ast_funcs: ASTCallbackMapping = defaultdict(list)
-    for fixer in FIXERS.values():
-        if fixer.name not in settings.enabled_fixers:
-            continue
-        if fixer.min_version <= state.settings.target_version and (
-            fixer.condition is None or fixer.condition(state)
-        ):
-            for type_, type_funcs in fixer.ast_funcs.items():
+    for condition, group_funcs in settings.fixer_groups:
+        if condition is None or condition(state):
+            for type_, type_funcs in group_funcs.items():
                 ast_funcs[type_].extend(type_funcs)
     return ast_funcs
+
+
+# Register the fixers, which need the definitions above.
+import django_upgrade.fixers  # noqa: E402, F401
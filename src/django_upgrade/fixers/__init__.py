@@ -0,0 +1,41 @@
+# Import all fixers to register them. Listed explicitly rather than discovered
+# at runtime, to keep startup fast. tests/test_data.py checks this is complete.
+from __future__ import annotations
+
+from django_upgrade.fixers import admin_allow_tags
+from django_upgrade.fixers import admin_decorators
+from django_upgrade.fixers import admin_lookup_needs_distinct
+from django_upgrade.fixers import admin_register
+from django_upgrade.fixers import assert_form_error
+from django_upgrade.fixers import assert_set_methods
+from django_upgrade.fixers import check_constraint_condition
+from django_upgrade.fixers import compatibility_imports
+from django_upgrade.fixers import crypto_get_random_string
+from django_upgrade.fixers import default_app_config
+from django_upgrade.fixers import django_urls
+from django_upgrade.fixers import email_validator
+from django_upgrade.fixers import format_html
+from django_upgrade.fixers import forms_model_multiple_choice_field
+from django_upgrade.fixers import index_together
+from django_upgrade.fixers import management_commands
+from django_upgrade.fixers import null_boolean_field
+from django_upgrade.fixers import on_delete
+from django_upgrade.fixers import password_reset_timeout_days
+from django_upgrade.fixers import postgres_float_range_field
+from django_upgrade.fixers import queryset_paginator
+from django_upgrade.fixers import request_headers
+from django_upgrade.fixers import request_user_attributes
+from django_upgrade.fixers import settings_database_postgresql
+from django_upgrade.fixers import settings_storages
+from django_upgrade.fixers import signal_providing_args
+from django_upgrade.fixers import test_http_headers
+from django_upgrade.fixers import testcase_databases
+from django_upgrade.fixers import timezone_fixedoffset
+from django_upgrade.fixers import use_l10n
+from django_upgrade.fixers import utils_encoding
+from django_upgrade.fixers import utils_http
+from django_upgrade.fixers import utils_text
+from django_upgrade.fixers import utils_timezone
+from django_upgrade.fixers import utils_translation
+from django_upgrade.fixers import versioned_branches
+from django_upgrade.fixers import versioned_test_skip_decorators
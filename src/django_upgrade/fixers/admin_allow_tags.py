@@ -31,10 +31,7 @@ def visit_Assign(
     parents: tuple[ast.AST, ...],
 ) -> Iterable[tuple[Offset, TokenFunc]]:
     if (
-        (
-            "admin" in state.from_imports["django.contrib"]
-            or "admin" in state.from_imports["django.contrib.gis"]
-        )
+        state.admin_imported
         and len(node.targets) == 1
         and isinstance(node.targets[0], ast.Attribute)
         and node.targets[0].attr == "allow_tags"
@@ -95,13 +95,10 @@ def visit_Module_or_ClassDef(
     else:
         display_func_args = 2
 
-    # Check for 'from django.contrib import admin' from state.from_imports,
-    # but also directly when visiting a module. state.from_imports isn’t
-    # populated yet when visiting a module... (could fix by doing two passes?)
-    admin_imported = (
-        "admin" in state.from_imports["django.contrib"]
-        or "admin" in state.from_imports["django.contrib.gis"]
-    )
+    # Check for 'from django.contrib import admin' from state.admin_imported,
+    # but also directly when visiting a module. state.admin_imported isn’t
+    # set yet when visiting a module... (could fix by doing two passes?)
+    admin_imported = state.admin_imported
 
     for subnode in ast.iter_child_nodes(node):
         # coverage bug
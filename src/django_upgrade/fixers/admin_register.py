@@ -55,20 +55,13 @@ unregistered_site_models: MutableMapping[State, dict[str, set[str] | Literal[Tru
 )
 
 
-def _is_django_admin_imported(state: State) -> bool:
-    return (
-        "admin" in state.from_imports["django.contrib"]
-        or "admin" in state.from_imports["django.contrib.gis"]
-    )
-
-
 @fixer.register(ast.ClassDef)
 def visit_ClassDef(
     state: State,
     node: ast.ClassDef,
     parents: tuple[ast.AST, ...],
 ) -> Iterable[tuple[Offset, TokenFunc]]:
-    if _is_django_admin_imported(state) and not uses_full_super_in_init_or_new(node):
+    if state.admin_imported and not uses_full_super_in_init_or_new(node):
         admin_detailses = decorable_admins.setdefault(state, {})
         if node.name in admin_detailses:
             # Duplicate name, ignore
@@ -155,7 +148,7 @@ def visit_Call(
     parents: tuple[ast.AST, ...],
 ) -> Iterable[tuple[Offset, TokenFunc]]:
     if (
-        _is_django_admin_imported(state)
+        state.admin_imported
         and isinstance(parents[-1], ast.Expr)
         and isinstance(node.func, ast.Attribute)
     ):
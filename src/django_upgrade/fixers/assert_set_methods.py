@@ -22,6 +22,7 @@ fixer = Fixer(
     __name__,
     min_version=(4, 2),
     condition=lambda state: state.looks_like_test_file,
+    triggers=(b"assertFormsetError", b"assertQuerysetEqual"),
 )
 
 MODULE = "django.test.testcase"
@@ -45,10 +45,7 @@ def visit_Call(
                 and node.func.attr == "CheckConstraint"
                 and isinstance(node.func.value, ast.Name)
                 and node.func.value.id == "models"
-                and (
-                    "models" in state.from_imports["django.db"]
-                    or "models" in state.from_imports["django.contrib.gis.db"]
-                )
+                and state.models_imported
             )
         )
         and (kwarg_names := {k.arg for k in node.keywords})
@@ -21,6 +21,7 @@ fixer = Fixer(
     __name__,
     min_version=(3, 2),
     condition=lambda state: state.looks_like_dunder_init_file,
+    triggers=(b"default_app_config",),
 )
 
 
@@ -102,10 +102,7 @@ def visit_ClassDef(
     except IndexError:
         indexes = None
 
-    if (
-        "models" in state.from_imports["django.db"]
-        or "models" in state.from_imports["django.contrib.gis.db"]
-    ):
+    if state.models_imported:
         index_ref = "models.Index"
     elif (
         "Index" in state.from_imports["django.db.models"]
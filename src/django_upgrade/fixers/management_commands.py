@@ -21,6 +21,7 @@ fixer = Fixer(
     __name__,
     min_version=(3, 2),
     condition=lambda state: state.looks_like_command_file,
+    triggers=(b"requires_system_checks",),
 )
 
 
@@ -24,6 +24,7 @@ fixer = Fixer(
     __name__,
     min_version=(3, 1),
     condition=lambda state: state.looks_like_settings_file,
+    triggers=(b"PASSWORD_RESET_TIMEOUT_DAYS",),
 )
 
 OLD_NAME = "PASSWORD_RESET_TIMEOUT_DAYS"
@@ -25,6 +25,7 @@ from django_upgrade.tokens import str_repr_matching
 fixer = Fixer(
     __name__,
     min_version=(2, 2),
+    triggers=(b"META",),
 )
 
 
@@ -25,6 +25,7 @@ from django_upgrade.tokens import find
 fixer = Fixer(
     __name__,
     min_version=(1, 10),
+    triggers=(b"is_anonymous", b"is_authenticated"),
 )
 
 
@@ -27,6 +27,7 @@ fixer = Fixer(
     __name__,
     min_version=(4, 2),
     condition=lambda state: state.looks_like_settings_file,
+    triggers=(b"DEFAULT_FILE_STORAGE", b"STATICFILES_STORAGE"),
 )
 
 # Keep track of seen assignments
@@ -34,6 +34,7 @@ fixer = Fixer(
     __name__,
     min_version=(4, 2),
     condition=lambda state: state.looks_like_test_file,
+    triggers=(b"HTTP_",),
 )
 
 HEADERS_KWARG = "headers"
@@ -23,6 +23,7 @@ fixer = Fixer(
     __name__,
     min_version=(2, 2),
     condition=lambda state: state.looks_like_test_file,
+    triggers=(b"allow_database_queries", b"multi_db"),
 )
 
 
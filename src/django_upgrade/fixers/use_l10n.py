@@ -21,6 +21,7 @@ fixer = Fixer(
     __name__,
     min_version=(4, 0),
     condition=lambda state: state.looks_like_settings_file,
+    triggers=(b"USE_L10N",),
 )
 
 
@@ -1,16 +1,26 @@
 from __future__ import annotations
 
 import argparse
+import mmap
+import operator
+import os
 import sys
+import tempfile
+import time
 import tokenize
 from collections.abc import Sequence
+from concurrent.futures import ProcessPoolExecutor
+from functools import cache
+from functools import partial
+from functools import reduce
+from hashlib import blake2b
 from importlib import metadata
+from pathlib import Path
 from typing import Any
 from typing import cast
 
 from tokenize_rt import UNIMPORTANT_WS
 from tokenize_rt import Token
-from tokenize_rt import reversed_enumerate
 from tokenize_rt import src_to_tokens
 from tokenize_rt import tokens_to_src
 
@@ -20,6 +30,9 @@ from django_upgrade.data import Settings
 from django_upgrade.data import visit
 from django_upgrade.tokens import DEDENT
 
+# Minimum number of files to process in parallel.
+PARALLEL_MIN_FILES = 32
+
 
 def main(argv: Sequence[str] | None = None) -> int:
     parser = argparse.ArgumentParser(prog="django-upgrade")
@@ -53,6 +66,11 @@ def main(argv: Sequence[str] | None = None) -> int:
         action="store_true",
         help="Exit with a zero return code even if files have changed.",
     )
+    parser.add_argument(
+        "--no-cache",
+        action="store_true",
+        help="Don’t read or write the cache of previous results.",
+    )
     parser.add_argument(
         "--version",
         action="version",
@@ -88,15 +106,33 @@ def main(argv: Sequence[str] | None = None) -> int:
         skip_fixers=set(args.skip) if args.skip else None,
     )
 
-    ret = 0
-    for filename in args.filenames:
-        ret |= fix_file(
-            filename,
-            settings,
-            exit_zero_even_if_changed=args.exit_zero_even_if_changed,
-        )
+    use_cache = not args.no_cache
+    if use_cache:
+        prune_cache()
+
+    fix = partial(
+        fix_file,
+        settings=settings,
+        exit_zero_even_if_changed=args.exit_zero_even_if_changed,
+        use_cache=use_cache,
+    )
+    # Files are independent, so process them in parallel when there are
+    # enough to outweigh the cost of starting worker processes. Stdin is read
+    # in-process.
+    workers = os.cpu_count() or 1
+    if (
+        workers > 1
+        and len(args.filenames) >= PARALLEL_MIN_FILES
+        and "-" not in args.filenames
+    ):
+        # A few chunks per worker balances load without much IPC overhead.
+        chunksize = max(1, len(args.filenames) // (workers * 4))
+        with ProcessPoolExecutor(max_workers=workers) as executor:
+            results = list(executor.map(fix, args.filenames, chunksize=chunksize))
+    else:
+        results = [fix(filename) for filename in args.filenames]
 
-    return ret
+    return reduce(operator.or_, results, 0)
 
 
 def fixer_type(string: str) -> str:
@@ -122,12 +158,32 @@ def fix_file(
     filename: str,
     settings: Settings,
     exit_zero_even_if_changed: bool,
+    use_cache: bool,
 ) -> int:
     if filename == "-":
         contents_bytes = sys.stdin.buffer.read()
+        needs_fixing = may_need_fixing(contents_bytes, settings)
     else:
         with open(filename, "rb") as fb:
-            contents_bytes = fb.read()
+            try:
+                contents_map = mmap.mmap(fb.fileno(), 0, access=mmap.ACCESS_READ)
+            except (OSError, ValueError):
+                # Empty files, pipes, and other files that can’t be mapped
+                contents_bytes = fb.read()
+                needs_fixing = may_need_fixing(contents_bytes, settings)
+            else:
+                with contents_map:
+                    if not may_need_fixing(contents_map, settings):
+                        # Only check the encoding, without copying the file
+                        # into a bytes object.
+                        try:
+                            str(contents_map, "utf-8")
+                        except UnicodeDecodeError:
+                            print(f"{filename} is non-utf-8 (not supported)")
+                            return 1
+                        return 0
+                    contents_bytes = bytes(contents_map)
+                needs_fixing = True
 
     try:
         contents_text_orig = contents_text = contents_bytes.decode()
@@ -135,7 +191,13 @@ def fix_file(
         print(f"{filename} is non-utf-8 (not supported)")
         return 1
 
-    contents_text = apply_fixers(contents_text, settings, filename)
+    if needs_fixing:
+        if use_cache:
+            contents_text = cached_apply_fixers(
+                contents_bytes, contents_text, settings, filename
+            )
+        else:
+            contents_text = apply_fixers(contents_text, settings, filename)
 
     if filename == "-":
         print(contents_text, end="")
@@ -149,6 +211,148 @@ def fix_file(
     return contents_text != contents_text_orig
 
 
+def may_need_fixing(contents: bytes | mmap.mmap, settings: Settings) -> bool:
+    """
+    Cheap check for whether any enabled fixer could apply, to skip parsing
+    most files that cannot change.
+    """
+    # find() rather than `in`, since mmap's `in` only checks single bytes.
+    return any(contents.find(trigger) != -1 for trigger in settings.trigger_bytes)
+
+
+# Cache entries are either a marker for unchanged files, or a prefix followed
+# by the rewritten file.
+CACHE_UNCHANGED = b"="
+CACHE_CHANGED = b"+"
+# Entries not used for this long are removed, checked at most once per
+# CACHE_PRUNE_INTERVAL.
+CACHE_MAX_AGE = 30 * 24 * 60 * 60
+CACHE_PRUNE_INTERVAL = 24 * 60 * 60
+CACHE_PRUNE_STAMP = ".last-prune"
+
+
+def cached_apply_fixers(
+    contents_bytes: bytes,
+    contents_text: str,
+    settings: Settings,
+    filename: str,
+) -> str:
+    """
+    Run apply_fixers(), caching the result on disk by the file contents,
+    settings, and filename, since re-runs are mostly on unchanged files.
+    """
+    cache_path = get_cache_dir() / cache_key(contents_bytes, settings, filename)
+    try:
+        entry = cache_path.read_bytes()
+    except OSError:
+        entry = b""
+    else:
+        try:
+            # Mark as recently used, to avoid pruning.
+            os.utime(cache_path)
+        except OSError:
+            pass
+
+    if entry == CACHE_UNCHANGED:
+        return contents_text
+    if entry.startswith(CACHE_CHANGED):
+        try:
+            return entry[len(CACHE_CHANGED) :].decode()
+        except UnicodeDecodeError:
+            pass
+
+    fixed_text = apply_fixers(contents_text, settings, filename)
+
+    if fixed_text == contents_text:
+        entry = CACHE_UNCHANGED
+    else:
+        entry = CACHE_CHANGED + fixed_text.encode()
+    write_cache_entry(cache_path, entry)
+
+    return fixed_text
+
+
+def write_cache_entry(cache_path: Path, entry: bytes) -> None:
+    tmp_name = None
+    try:
+        cache_path.parent.mkdir(parents=True, exist_ok=True)
+        with tempfile.NamedTemporaryFile(
+            dir=cache_path.parent, prefix=".tmp-", delete=False
+        ) as tmp:
+            tmp_name = tmp.name
+            tmp.write(entry)
+        os.replace(tmp_name, cache_path)
+    except OSError:
+        if tmp_name is not None:
+            try:
+                os.unlink(tmp_name)
+            except OSError:
+                pass
+
+
+def prune_cache() -> None:
+    """
+    Remove cache entries that haven’t been used for CACHE_MAX_AGE.
+    """
+    cache_dir = get_cache_dir()
+    stamp = cache_dir / CACHE_PRUNE_STAMP
+    now = time.time()
+    try:
+        if now - stamp.stat().st_mtime < CACHE_PRUNE_INTERVAL:
+            return
+    except OSError:
+        pass
+
+    try:
+        with os.scandir(cache_dir) as entries:
+            for entry in entries:
+                if entry.name == CACHE_PRUNE_STAMP:
+                    continue
+                try:
+                    if now - entry.stat().st_mtime > CACHE_MAX_AGE:
+                        os.unlink(entry.path)
+                except OSError:
+                    pass
+        stamp.touch()
+    except OSError:
+        pass
+
+
+def get_cache_dir() -> Path:
+    cache_home = os.environ.get("XDG_CACHE_HOME") or os.path.expanduser("~/.cache")
+    return Path(cache_home) / "django-upgrade"
+
+
+def cache_key(contents_bytes: bytes, settings: Settings, filename: str) -> str:
+    # The filename is included because some fixers only apply to files with
+    # particular names, such as admin.py or settings.py. The Python version is
+    # included because it decides which syntax ast_parse() accepts.
+    key = blake2b(contents_bytes)
+    key.update(
+        repr(
+            (
+                _version(),
+                _tokenize_rt_version(),
+                sys.version_info[:2],
+                settings.target_version,
+                sorted(settings.enabled_fixers),
+                filename,
+            )
+        ).encode()
+    )
+    return key.hexdigest()
+
+
+@cache
+def _version() -> str:
+    return metadata.version("django-upgrade")
+
+
+@cache
+def _tokenize_rt_version() -> str:
+    return metadata.version("tokenize-rt")
+
+
 def apply_fixers(contents_text: str, settings: Settings, filename: str) -> str:
     try:
         ast_obj = ast_parse(contents_text)
@@ -167,13 +371,19 @@ def apply_fixers(contents_text: str, settings: Settings, filename: str) -> str:
 
     fixup_dedent_tokens(tokens)
 
-    for i, token in reversed_enumerate(tokens):
-        if not token.src:
+    # Hot loop over every token, so avoid reversed_enumerate()'s generator,
+    # repeated attribute lookups, and building Offset tuples. Callbacks are
+    # keyed by packed offsets, see visit().
+    callbacks_get = callbacks.get
+    for i in range(len(tokens) - 1, -1, -1):
+        token = tokens[i]
+        # Skip empty tokens, and tokens added by fixers, which have no position
+        if not token.src or token.line is None:
             continue
-        # though this is a defaultdict, by using `.get()` this function's
-        # self time is almost 50% faster
-        for callback in callbacks.get(token.offset, ()):
-            callback(tokens, i)
+        token_callbacks = callbacks_get((token.line << 32) | token.utf8_byte_offset)
+        if token_callbacks:
+            for callback in token_callbacks:
+                callback(tokens, i)
 
     # no types for tokenize-rt
     return tokens_to_src(tokens)  # type: ignore [no-any-return]
@@ -189,6 +399,7 @@ def fixup_dedent_tokens(tokens: list[Token]) -> None:
     |^    ^- DEDENT
     |+----UNIMPORTANT_WS
     """
-    for i, token in enumerate(tokens):
-        if token.name == UNIMPORTANT_WS and tokens[i + 1].name == DEDENT:
-            tokens[i], tokens[i + 1] = tokens[i + 1], tokens[i]
+    # Check for the rarer DEDENT first, so most tokens need only one check.
+    for i in range(1, len(tokens)):
+        if tokens[i].name == DEDENT and tokens[i - 1].name == UNIMPORTANT_WS:
+            tokens[i - 1], tokens[i] = tokens[i], tokens[i - 1]
@@ -3,8 +3,10 @@ from __future__ import annotations
 import ast
 from textwrap import dedent
 
+from django_upgrade.data import FIXERS
 from django_upgrade.data import Settings
 from django_upgrade.main import apply_fixers
+from django_upgrade.main import may_need_fixing
 
 
 def check_noop(contents: str, settings: Settings, filename: str = "example.py") -> None:
@@ -21,3 +23,26 @@ def check_transformed(
     ast.parse(dedented_after)  # check that the target is valid python code
     fixed = apply_fixers(dedented_before, settings=settings, filename=filename)
     assert fixed == dedented_after
+    if dedented_before != dedented_after:
+        check_triggers(dedented_before, settings, filename)
+
+
+def check_triggers(contents: str, settings: Settings, filename: str) -> None:
+    """
+    Check that each fixer that changes the contents on its own declares a
+    trigger present in them, so the preflight doesn't skip the file.
+    """
+    contents_bytes = contents.encode()
+    for name in sorted(settings.enabled_fixers):
+        if FIXERS[name].min_version > settings.target_version:
+            continue
+        only_settings = Settings(
+            target_version=settings.target_version, only_fixers={name}
+        )
+        if (
+            apply_fixers(contents, settings=only_settings, filename=filename)
+            != contents
+        ):
+            assert may_need_fixing(
+                contents_bytes, only_settings
+            ), f"{name} triggers missing"
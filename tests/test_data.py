@@ -1,12 +1,15 @@
 from __future__ import annotations
 
+import pkgutil
 import re
 from collections import defaultdict
 from pathlib import Path
 
 import pytest
 
+from django_upgrade import fixers
 from django_upgrade.data import FIXERS
+from django_upgrade.data import Fixer
 from django_upgrade.data import Settings
 from django_upgrade.data import State
 
@@ -265,3 +268,16 @@ def test_all_fixers_are_documented() -> None:
 
     undocumented = names - docs
     assert not undocumented
+
+
+def test_fixer_duplicate_name() -> None:
+    with pytest.raises(AssertionError) as excinfo:
+        Fixer("django_upgrade.fixers.admin_allow_tags", min_version=(2, 0))
+
+    assert str(excinfo.value) == "duplicate fixer admin_allow_tags"
+
+
+def test_all_fixers_are_imported() -> None:
+    modules = {info.name for info in pkgutil.iter_modules(fixers.__path__)}
+
+    assert set(FIXERS) == modules
@@ -1,9 +1,11 @@
 from __future__ import annotations
 
 import io
+import os
 import re
 import subprocess
 import sys
+from pathlib import Path
 from textwrap import dedent
 from unittest import mock
 
@@ -12,6 +14,7 @@ from tokenize_rt import UNIMPORTANT_WS
 from tokenize_rt import src_to_tokens
 
 from django_upgrade import __main__  # noqa: F401
+from django_upgrade.main import PARALLEL_MIN_FILES
 from django_upgrade.main import fixup_dedent_tokens
 from django_upgrade.main import main
 from django_upgrade.tokens import DEDENT
@@ -79,6 +82,45 @@ def test_main_non_utf8_bytes(tmp_path, capsys):
     assert err == ""
 
 
+def test_main_non_utf8_bytes_with_triggers(tmp_path, capsys):
+    path = tmp_path / "example.py"
+    path.write_bytes(
+        "# -*- coding: cp1252 -*-\nimport django\nx = €\n".encode("cp1252")
+    )
+
+    result = main([str(path)])
+
+    assert result == 1
+    out, err = capsys.readouterr()
+    assert out == f"{path} is non-utf-8 (not supported)\n"
+    assert err == ""
+
+
+def test_main_empty_file(tmp_path, capsys):
+    path = tmp_path / "example.py"
+    path.write_text("")
+
+    result = main([str(path)])
+
+    assert result == 0
+    out, err = capsys.readouterr()
+    assert out == ""
+    assert err == ""
+
+
+def test_main_file_unmappable(tmp_path, capsys):
+    path = tmp_path / "example.py"
+    path.write_text("from django.core.paginator import QuerySetPaginator\n")
+
+    with mock.patch("django_upgrade.main.mmap.mmap", side_effect=OSError):
+        result = main([str(path)])
+
+    assert result == 1
+    out, err = capsys.readouterr()
+    assert err == f"Rewriting {path}\n"
+    assert path.read_text() == "from django.core.paginator import Paginator\n"
+
+
 def test_main_file(tmp_path, capsys):
     path = tmp_path / "example.py"
     path.write_text("from django.core.paginator import QuerySetPaginator\n")
@@ -91,6 +133,194 @@ def test_main_file(tmp_path, capsys):
     assert path.read_text() == "from django.core.paginator import Paginator\n"
 
 
+def test_main_multiple_files(tmp_path, capfd):
+    path1 = tmp_path / "example1.py"
+    path1.write_text("from django.core.paginator import QuerySetPaginator\n")
+    path2 = tmp_path / "example2.py"
+    path2.write_text('print("hi")\n')
+
+    result = main([str(path1), str(path2)])
+
+    assert result == 1
+    out, err = capfd.readouterr()
+    assert out == ""
+    assert err == f"Rewriting {path1}\n"
+    assert path1.read_text() == "from django.core.paginator import Paginator\n"
+    assert path2.read_text() == 'print("hi")\n'
+
+
+def test_main_multiple_files_parallel(tmp_path, capfd):
+    paths = [tmp_path / f"example{n}.py" for n in range(PARALLEL_MIN_FILES)]
+    for path in paths:
+        path.write_text('print("hi")\n')
+    paths[0].write_text("from django.core.paginator import QuerySetPaginator\n")
+
+    with mock.patch("django_upgrade.main.os.cpu_count", return_value=2):
+        result = main([str(path) for path in paths])
+
+    assert result == 1
+    out, err = capfd.readouterr()
+    assert out == ""
+    assert err == f"Rewriting {paths[0]}\n"
+    assert paths[0].read_text() == "from django.core.paginator import Paginator\n"
+    assert paths[1].read_text() == 'print("hi")\n'
+
+
+def test_main_file_no_triggers(tmp_path, capsys):
+    path = tmp_path / "example.py"
+    path.write_text('print("hi")\n')
+
+    with mock.patch("django_upgrade.main.apply_fixers") as apply_fixers:
+        result = main([str(path)])
+
+    assert result == 0
+    apply_fixers.assert_not_called()
+    assert path.read_text() == 'print("hi")\n'
+
+
+def test_main_file_no_triggers_for_enabled_fixers(tmp_path, capsys):
+    path = tmp_path / "example.py"
+    source = "from django.core.paginator import QuerySetPaginator\n"
+    path.write_text(source)
+
+    with mock.patch("django_upgrade.main.apply_fixers") as apply_fixers:
+        result = main(["--only", "request_headers", str(path)])
+
+    assert result == 0
+    apply_fixers.assert_not_called()
+    assert path.read_text() == source
+
+
+def test_main_file_cached(tmp_path, capsys, cache_home):
+    path = tmp_path / "example.py"
+    source = "from django.core.paginator import QuerySetPaginator\n"
+    path.write_text(source)
+    main([str(path)])
+    capsys.readouterr()
+    assert len(cache_entries(cache_home)) == 1
+    path.write_text(source)
+
+    with mock.patch("django_upgrade.main.apply_fixers") as apply_fixers:
+        result = main([str(path)])
+
+    assert result == 1
+    apply_fixers.assert_not_called()
+    out, err = capsys.readouterr()
+    assert err == f"Rewriting {path}\n"
+    assert path.read_text() == "from django.core.paginator import Paginator\n"
+
+
+def test_main_file_cached_unchanged(tmp_path, cache_home):
+    path = tmp_path / "example.py"
+    source = "import django\nx = 1\n"
+    path.write_text(source)
+
+    result = main([str(path)])
+
+    assert result == 0
+    (entry,) = cache_entries(cache_home)
+    assert entry.read_bytes() == b"="
+
+    with mock.patch("django_upgrade.main.apply_fixers") as apply_fixers:
+        result = main([str(path)])
+
+    assert result == 0
+    apply_fixers.assert_not_called()
+    assert path.read_text() == source
+
+
+def test_main_file_no_cache(tmp_path, capsys, cache_home):
+    path = tmp_path / "example.py"
+    path.write_text("from django.core.paginator import QuerySetPaginator\n")
+
+    result = main(["--no-cache", str(path)])
+
+    assert result == 1
+    assert path.read_text() == "from django.core.paginator import Paginator\n"
+    assert not (cache_home / "django-upgrade").exists()
+
+
+def test_main_file_cache_replace_fails(tmp_path, capsys, cache_home):
+    path = tmp_path / "example.py"
+    path.write_text("from django.core.paginator import QuerySetPaginator\n")
+
+    with mock.patch("django_upgrade.main.os.replace", side_effect=OSError):
+        result = main([str(path)])
+
+    assert result == 1
+    assert path.read_text() == "from django.core.paginator import Paginator\n"
+    assert list((cache_home / "django-upgrade").iterdir()) == []
+
+
+def test_main_prunes_old_cache_entries(tmp_path, cache_home):
+    cache_dir = cache_home / "django-upgrade"
+    cache_dir.mkdir()
+    old = cache_dir / "old"
+    old.write_bytes(b"=")
+    os.utime(old, (0, 0))
+    recent = cache_dir / "recent"
+    recent.write_bytes(b"=")
+    path = tmp_path / "example.py"
+    path.write_text('print("hi")\n')
+
+    main([str(path)])
+
+    assert not old.exists()
+    assert recent.exists()
+    assert (cache_dir / ".last-prune").exists()
+
+    # Pruning is skipped until the interval passes.
+    old.write_bytes(b"=")
+    os.utime(old, (0, 0))
+
+    main([str(path)])
+
+    assert old.exists()
+
+
+def test_main_file_cache_keyed_by_settings(tmp_path, capsys):
+    path = tmp_path / "example.py"
+    source = "from django.core.paginator import QuerySetPaginator\n"
+    path.write_text(source)
+    main(["--skip", "queryset_paginator", str(path)])
+
+    result = main([str(path)])
+
+    assert result == 1
+    assert path.read_text() == "from django.core.paginator import Paginator\n"
+
+
+def test_main_file_cache_keyed_by_python_version(tmp_path, capsys, cache_home):
+    path = tmp_path / "example.py"
+    source = "import django\nx = 1\n"
+    path.write_text(source)
+    main([str(path)])
+
+    with mock.patch.object(sys, "version_info", (3, 99, 0, "final", 0)):
+        main([str(path)])
+
+    assert len(cache_entries(cache_home)) == 2
+
+
+def test_main_file_cache_unwritable(tmp_path, capsys, cache_home):
+    (cache_home / "django-upgrade").write_text("")
+    path = tmp_path / "example.py"
+    path.write_text("from django.core.paginator import QuerySetPaginator\n")
+
+    result = main([str(path)])
+
+    assert result == 1
+    assert path.read_text() == "from django.core.paginator import Paginator\n"
+
+
+def cache_entries(cache_home: Path) -> list[Path]:
+    return [
+        p
+        for p in (cache_home / "django-upgrade").iterdir()
+        if not p.name.startswith(".")
+    ]
+
+
 def test_main_exit_zero_even_if_changed(tmp_path, capsys):
     path = tmp_path / "example.py"
     path.write_text("from django.core.paginator import QuerySetPaginator\n")